@@ -16,11 +16,13 @@ Sources:
 For this project, we're assuming customers live in Switzerland and are using the Swiss energy pricing configuration defined here.
 """
 
+from array import array
 from dataclasses import dataclass
-from typing import List
+from functools import lru_cache
+from typing import Tuple
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TariffPeriod:
     """Defines when a tariff applies"""
     name: str
@@ -120,6 +122,65 @@ SWISS_ENERGY_CONFIG = {
 }
 
 
+# Typed, immutable views of the two tariffs. Code paths should read these;
+# SWISS_ENERGY_CONFIG stays the JSON shape served to the frontend.
+HIGH_TARIFF = TariffPeriod(
+    name=SWISS_ENERGY_CONFIG["high_tariff"]["name"],
+    start_hour=SWISS_ENERGY_CONFIG["high_tariff"]["schedule"]["weekdays"]["start"],
+    end_hour=SWISS_ENERGY_CONFIG["high_tariff"]["schedule"]["weekdays"]["end"],
+    weekdays_only=True,
+    rate_chf_per_kwh=SWISS_ENERGY_CONFIG["high_tariff"]["rate_chf_per_kwh"],
+)
+LOW_TARIFF = TariffPeriod(
+    name=SWISS_ENERGY_CONFIG["low_tariff"]["name"],
+    start_hour=SWISS_ENERGY_CONFIG["low_tariff"]["schedule"]["weekdays"]["start"],
+    end_hour=SWISS_ENERGY_CONFIG["low_tariff"]["schedule"]["weekdays"]["end"],
+    weekdays_only=False,
+    rate_chf_per_kwh=SWISS_ENERGY_CONFIG["low_tariff"]["rate_chf_per_kwh"],
+)
+
+
+def _build_tariff(hour: int, is_weekend: bool) -> dict:
+    """
+    Resolve the tariff for a given hour and day type.
+    
+    Only used at import time to fill the lookup tables below.
+    """
+    # Weekends are always low tariff; weekdays are high within 07:00-20:00
+    if not is_weekend and HIGH_TARIFF.start_hour <= hour < HIGH_TARIFF.end_hour:
+        return {"tariff": "high", "name": HIGH_TARIFF.name, "rate": HIGH_TARIFF.rate_chf_per_kwh}
+    return {"tariff": "low", "name": LOW_TARIFF.name, "rate": LOW_TARIFF.rate_chf_per_kwh}
+
+
+# Precomputed tariff lookup tables, one slot per hour of the week.
+# Indexed by day_of_week * 24 + hour, using PostgreSQL DOW (0=Sunday, 6=Saturday).
+# The config is static, so all the schedule branching is resolved once at import.
+_TARIFF_TABLE = tuple(
+    _build_tariff(hour, is_weekend=dow in (0, 6))
+    for dow in range(7)
+    for hour in range(24)
+)
+_RATE_TABLE = array("d", (tariff["rate"] for tariff in _TARIFF_TABLE))
+
+# 168-bit mask over the same slots: bit (day_of_week * 24 + hour) is set where
+# the high tariff applies, so the HT check is a shift and an AND - no branching
+HIGH_TARIFF_MASK = sum(
+    1 << slot
+    for slot, tariff in enumerate(_TARIFF_TABLE)
+    if tariff["tariff"] == "high"
+)
+
+
+def _slot(hour: int, is_weekend: bool) -> int:
+    """Map (hour, day type) onto a representative slot: Sunday for weekends, Monday for weekdays."""
+    return (0 if is_weekend else 24) + hour
+
+
+def is_high_tariff(day_of_week: int, hour: int) -> bool:
+    """Check whether the high tariff applies (day_of_week: 0=Sunday, 6=Saturday)."""
+    return bool((HIGH_TARIFF_MASK >> (day_of_week * 24 + hour)) & 1)
+
+
 def get_tariff_for_hour(hour: int, is_weekend: bool) -> dict:
     """
     Determine which tariff applies for a given hour and day type.
@@ -129,34 +190,9 @@ def get_tariff_for_hour(hour: int, is_weekend: bool) -> dict:
         is_weekend: True if Saturday or Sunday
     
     Returns:
-        Dict with tariff info
+        Dict with tariff info (shared instance - do not mutate)
     """
-    config = SWISS_ENERGY_CONFIG
-    
-    # Weekends are always low tariff
-    if is_weekend:
-        return {
-            "tariff": "low",
-            "name": config["low_tariff"]["name"],
-            "rate": config["low_tariff"]["rate_chf_per_kwh"],
-        }
-    
-    # Weekdays: check if within high tariff hours (07:00-20:00)
-    ht_start = config["high_tariff"]["schedule"]["weekdays"]["start"]
-    ht_end = config["high_tariff"]["schedule"]["weekdays"]["end"]
-    
-    if ht_start <= hour < ht_end:
-        return {
-            "tariff": "high",
-            "name": config["high_tariff"]["name"],
-            "rate": config["high_tariff"]["rate_chf_per_kwh"],
-        }
-    else:
-        return {
-            "tariff": "low",
-            "name": config["low_tariff"]["name"],
-            "rate": config["low_tariff"]["rate_chf_per_kwh"],
-        }
+    return _TARIFF_TABLE[_slot(hour, is_weekend)]
 
 
 def calculate_cost(kwh: float, hour: int = None, is_weekend: bool = None) -> float:
@@ -167,16 +203,19 @@ def calculate_cost(kwh: float, hour: int = None, is_weekend: bool = None) -> flo
     Otherwise uses average rate.
     """
     if hour is not None and is_weekend is not None:
-        tariff = get_tariff_for_hour(hour, is_weekend)
-        return kwh * tariff["rate"]
+        return kwh * _RATE_TABLE[_slot(hour, is_weekend)]
     else:
         return kwh * SWISS_ENERGY_CONFIG["average_rate_chf_per_kwh"]
 
 
-def get_hourly_rates() -> List[dict]:
+@lru_cache(maxsize=1)
+def get_hourly_rates() -> Tuple[dict, ...]:
     """
     Get rate for each hour of day (weekday and weekend).
     Useful for frontend visualization.
+    
+    The config is static, so the table is built once and the same
+    tuple is returned on every call (do not mutate the rows).
     """
     rates = []
     for hour in range(24):
@@ -192,4 +231,4 @@ def get_hourly_rates() -> List[dict]:
             "weekend_tariff": weekend_tariff["tariff"],
         })
     
-    return rates
+    return tuple(rates)